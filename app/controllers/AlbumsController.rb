@@ -13,6 +13,9 @@ class AlbumsController < ApplicationController
   def show
     @images = @album.images.with_attached_file
     @presenting_image_id = @campaign.player_display&.current_image_id.to_i
+    # Resolve each preview url once; the server-rendered cards and the grid
+    # payload both use it.
+    @image_preview_urls = @images.to_h { |image| [ image.id, image_preview_url(image) ] }
     @album_image_grid_payload = @images.map { |image| album_image_card_payload(image) }
   end
 
@@ -76,19 +79,22 @@ class AlbumsController < ApplicationController
       id: album.id,
       name: album.name,
       description: album.description,
-      url: album_path(album)
+      url: album_path(album),
+      edit_url: edit_album_path(album)
     }
   end
 
   def album_image_card_payload(image)
+    path = image_path(image)
+
     {
       id: image.id,
       title: image.title,
       show_title: image.show_title,
-      url: image_path(image),
+      url: path,
       edit_url: edit_image_path(image),
-      delete_url: image_path(image),
-      preview_url: image_preview_url(image)
+      delete_url: path,
+      preview_url: @image_preview_urls[image.id]
     }
   end
 
@@ -13,8 +13,8 @@ class CampaignsController < ApplicationController
 
   def show
     @root_folder = @campaign.root_folder
-    @child_folders = @root_folder ? NaturalNameSort.sort(@root_folder.child_folders) : []
-    @root_albums = @root_folder ? NaturalNameSort.sort(@root_folder.albums) : []
+    @child_folders = @root_folder ? NaturalNameSort.sort(@root_folder.child_folders.with_child_counts) : []
+    @root_albums = @root_folder ? NaturalNameSort.sort(@root_folder.albums.with_image_count) : []
     @recent_images = @campaign.images.includes(:album).order(created_at: :desc).limit(current_user.dashboard_recent_count)
     @album_count = @campaign.albums.count
     @image_count = @campaign.images.count
@@ -50,7 +50,10 @@ class CampaignsController < ApplicationController
   end
 
   def tree
-    render json: FolderTreePresenter.new(@campaign).as_json
+    presenter = FolderTreePresenter.new(@campaign)
+    return unless stale?(etag: presenter.cache_version, template: false)
+
+    render json: presenter.as_json
   end
 
   private
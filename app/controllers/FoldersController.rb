@@ -11,9 +11,9 @@ class FoldersController < ApplicationController
   after_action :touch_campaign_activity, only: [ :show, :edit, :new, :create, :update, :destroy ]
 
   def show
-    @child_folders = NaturalNameSort.sort(@folder.child_folders)
-    @albums = NaturalNameSort.sort(@folder.albums)
-    @direct_image_count = Image.joins(:album).where(albums: { folder_id: @folder.id }).count
+    @child_folders = NaturalNameSort.sort(@folder.child_folders.with_child_counts)
+    @albums = NaturalNameSort.sort(@folder.albums.with_image_count)
+    @direct_image_count = @albums.sum(&:image_count)
   end
 
   def new
@@ -78,7 +78,9 @@ class FoldersController < ApplicationController
       id: folder.id,
       name: folder.name,
       description: folder.description,
-      url: folder_path(folder)
+      url: folder_path(folder),
+      edit_url: edit_folder_path(folder),
+      new_subfolder_url: new_folder_folder_path(folder)
     }
   end
 
@@ -26,7 +26,7 @@ class PlayerDisplaysController < ApplicationController
     if @player_display.valid?
       PlayerDisplay.transaction do
         record_presented_event!(previous_image) if previous_image.present?
-        @player_display.save!
+        @player_display.save!(validate: false)
       end
 
       respond_with_player_display(@player_display)
@@ -83,8 +83,8 @@ class PlayerDisplaysController < ApplicationController
 
     respond_to do |format|
       format.json { render json: payload }
-      format.turbo_stream { render_gm_panel_controls_turbo_stream(player_display) }
-      format.html { render_gm_panel_controls_turbo_stream(player_display) }
+      format.turbo_stream { render_gm_status_turbo_stream(player_display) }
+      format.html { render_gm_status_turbo_stream(player_display) }
     end
   end
 
@@ -174,13 +174,6 @@ class PlayerDisplaysController < ApplicationController
     ]
   end
 
-  def render_gm_panel_controls_turbo_stream(player_display)
-    render turbo_stream: [
-      gm_panel_header_stream(player_display),
-      gm_status_stream(player_display)
-    ]
-  end
-
   def render_gm_status_turbo_stream(player_display)
     render turbo_stream: [
       gm_status_stream(player_display)
@@ -3,6 +3,10 @@ class ApplicationController < ActionController::Base
   # Only allow modern browsers supporting webp images, web push, badges, import maps, CSS nesting, and CSS :has.
   allow_browser versions: :modern
 
+  # Browsing a campaign fires a GET per page, so views only bump its activity
+  # time once it is older than this; changes always touch it.
+  CAMPAIGN_ACTIVITY_INTERVAL = 1.minute
+
   helper_method :breadcrumbs
 
   private
@@ -23,6 +27,7 @@ class ApplicationController < ActionController::Base
     return if @campaign.blank?
     return if @campaign.destroyed?
     return if response.status >= 400
+    return if request.get? && @campaign.updated_at&.after?(CAMPAIGN_ACTIVITY_INTERVAL.ago)
 
     @campaign.touch
   end
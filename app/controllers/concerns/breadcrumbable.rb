@@ -8,7 +8,7 @@ module Breadcrumbable
     when Campaign
       [ [ resource.name, campaign_path(resource) ] ]
     when Folder
-      build_breadcrumbs(resource.campaign) + folder_lineage(resource)
+      build_breadcrumbs(breadcrumb_campaign_for(resource)) + folder_lineage(resource)
     when Album
       build_breadcrumbs(resource.folder) + [ [ resource.name, album_path(resource) ] ]
     when Image
@@ -18,6 +18,14 @@ module Breadcrumbable
     end
   end
 
+  # The controllers have usually loaded the campaign already; reuse it rather
+  # than loading it again through the folder.
+  def breadcrumb_campaign_for(folder)
+    return @campaign if @campaign.present? && @campaign.id == folder.campaign_id
+
+    folder.campaign
+  end
+
   def folder_lineage(folder)
     folder.ancestry.map { |ancestor| [ ancestor.name, folder_path(ancestor) ] }
   end
@@ -0,0 +1,33 @@
+import consumer from "./consumer"
+
+const subscriptions = new Map()
+
+export function subscribeToPlayerDisplay(campaignId, listener) {
+  const key = String(campaignId)
+  let entry = subscriptions.get(key)
+
+  if (!entry) {
+    const listeners = new Set()
+    const subscription = consumer.subscriptions.create(
+      { channel: "PlayerDisplayChannel", campaign_id: campaignId },
+      { received: (data) => listeners.forEach((receive) => receive(data)) }
+    )
+
+    entry = { listeners, subscription }
+    subscriptions.set(key, entry)
+  }
+
+  entry.listeners.add(listener)
+  let removed = false
+
+  return () => {
+    if (removed) return
+    removed = true
+
+    entry.listeners.delete(listener)
+    if (entry.listeners.size > 0) return
+
+    entry.subscription.unsubscribe()
+    if (subscriptions.get(key) === entry) subscriptions.delete(key)
+  }
+}
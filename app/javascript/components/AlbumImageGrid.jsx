@@ -1,11 +1,15 @@
-import React, { startTransition, useEffect, useLayoutEffect, useRef, useState } from "react"
+import React, { memo, startTransition, useEffect, useMemo, useRef, useState } from "react"
 import { createPortal } from "react-dom"
 
-import consumer from "../channels/consumer"
-import usePortalDismiss from "../hooks/usePortalDismiss"
-import { csrfToken } from "../lib/tree_utils"
+import { subscribeToPlayerDisplay } from "../channels/player_display_channel"
+import useContextMenu from "../hooks/useContextMenu"
+import { csrfToken } from "../lib/csrf"
+import { visitInContentFrame, workflowUrl } from "../lib/navigation"
 
-const MENU_VIEWPORT_PADDING = 12
+const MENU_BUTTON_CLASS = "tree-context-menu__button"
+const MENU_BUTTON_DANGER_CLASS = "tree-context-menu__button tree-context-menu__button--danger"
+const PRESENT_BUTTON_CLASS = "fantasy-button fantasy-button--primary image-card__present-button"
+const PRESENT_BUTTON_ACTIVE_CLASS = `${PRESENT_BUTTON_CLASS} fantasy-button--active is-active`
 
 function hasOwnKey(payload, key) {
   return Object.prototype.hasOwnProperty.call(payload, key)
@@ -27,27 +31,6 @@ function titleVisibilityLabel(image) {
   return image.showTitle ? "Title visible on player screen" : "Title hidden on player screen"
 }
 
-function visitInContentFrame(url) {
-  if (!url) return
-
-  if (window.Turbo?.visit) {
-    window.Turbo.visit(url, { frame: "content-body" })
-    return
-  }
-
-  window.location.assign(url)
-}
-
-function workflowUrl(url) {
-  if (!url) return url
-
-  const returnTo = `${window.location.pathname}${window.location.search}`
-  const target = new URL(url, window.location.origin)
-  target.searchParams.set("return_to", returnTo)
-
-  return `${target.pathname}${target.search}${target.hash}`
-}
-
 function parseJsonResponse(text) {
   if (!text) return null
 
@@ -63,46 +46,7 @@ function contextMenuLabel(image) {
 }
 
 function ImageCardContextMenu({ x, y, image, isPresenting, isBusy, onClose, onRename, onToggleTitle, onPresent, onEdit, onDelete }) {
-  const menuRef = useRef(null)
-  const [position, setPosition] = useState({ x, y })
-
-  useEffect(() => {
-    setPosition({ x, y })
-  }, [x, y])
-
-  usePortalDismiss({ containerRef: menuRef, onClose })
-
-  useEffect(() => {
-    function handlePointerDown(event) {
-      if (!menuRef.current) return
-      if (menuRef.current.contains(event.target)) return
-      onClose()
-    }
-
-    document.addEventListener("pointerdown", handlePointerDown)
-
-    return () => {
-      document.removeEventListener("pointerdown", handlePointerDown)
-    }
-  }, [onClose])
-
-  useLayoutEffect(() => {
-    if (!menuRef.current) return
-
-    const rect = menuRef.current.getBoundingClientRect()
-    const nextPosition = {
-      x: Math.max(MENU_VIEWPORT_PADDING, Math.min(x, window.innerWidth - rect.width - MENU_VIEWPORT_PADDING)),
-      y: Math.max(MENU_VIEWPORT_PADDING, Math.min(y, window.innerHeight - rect.height - MENU_VIEWPORT_PADDING))
-    }
-
-    setPosition((currentPosition) => {
-      if (currentPosition.x === nextPosition.x && currentPosition.y === nextPosition.y) {
-        return currentPosition
-      }
-
-      return nextPosition
-    })
-  }, [x, y, image])
+  const { menuRef, position } = useContextMenu({ x, y, contentKey: image, onClose })
 
   if (!image || typeof document === "undefined" || !document.body) {
     return null
@@ -135,7 +79,7 @@ function ImageCardContextMenu({ x, y, image, isPresenting, isBusy, onClose, onRe
               type="button"
               role="menuitem"
               disabled={item.disabled}
-              className={`tree-context-menu__button ${item.danger ? "tree-context-menu__button--danger" : ""}`.trim()}
+              className={item.danger ? MENU_BUTTON_DANGER_CLASS : MENU_BUTTON_CLASS}
               onClick={item.onSelect}
             >
               {item.label}
@@ -148,23 +92,111 @@ function ImageCardContextMenu({ x, y, image, isPresenting, isBusy, onClose, onRe
   )
 }
 
+function ImageRenameInput({ image, disabled, suppressBlurRef, actions }) {
+  const [value, setValue] = useState(image.title)
+
+  return (
+    <input
+      type="text"
+      className="image-card__rename-input"
+      value={value}
+      autoFocus
+      disabled={disabled}
+      onChange={(event) => setValue(event.currentTarget.value)}
+      onFocus={(event) => event.currentTarget.select()}
+      onBlur={() => {
+        if (suppressBlurRef.current) {
+          suppressBlurRef.current = false
+          return
+        }
+
+        actions.submitRename(image, value)
+      }}
+      onKeyDown={(event) => {
+        if (event.key === "Enter") {
+          event.preventDefault()
+          actions.submitRename(image, value)
+        } else if (event.key === "Escape") {
+          event.preventDefault()
+          suppressBlurRef.current = true
+          actions.cancelRename(image.id)
+        }
+      }}
+    />
+  )
+}
+
+const ImageCard = memo(function ImageCard({ image, isPresenting, isBusy, isRenaming, inlineError, suppressRenameBlurRef, actions }) {
+  return (
+    <article className="image-card" onContextMenu={(event) => actions.openContextMenu(event, image.id)}>
+      <div className="image-card__thumb-shell">
+        <a href={image.url} className="image-card__thumb-link" data-turbo-frame="content-body">
+          <div className="image-card__thumbnail">
+            {image.previewUrl ? (
+              <img
+                src={image.previewUrl}
+                alt={image.title}
+                className="image-card__preview"
+                loading="lazy"
+                decoding="async"
+              />
+            ) : (
+              <div className="image-card__placeholder">No preview available</div>
+            )}
+          </div>
+        </a>
+
+        <button
+          type="button"
+          className={isPresenting ? PRESENT_BUTTON_ACTIVE_CLASS : PRESENT_BUTTON_CLASS}
+          aria-label={`Present ${image.title}`}
+          aria-pressed={isPresenting ? "true" : "false"}
+          disabled={isBusy}
+          onClick={() => actions.present(image)}
+        >
+          {isPresenting ? "Presenting" : "Present"}
+        </button>
+      </div>
+
+      <div className="image-card__copy">
+        {isRenaming ? (
+          <ImageRenameInput
+            image={image}
+            disabled={isBusy}
+            suppressBlurRef={suppressRenameBlurRef}
+            actions={actions}
+          />
+        ) : (
+          <h3 className="image-card__title">
+            <a href={image.url} className="card-title-link" data-turbo-frame="content-body">
+              {image.title}
+            </a>
+          </h3>
+        )}
+
+        <p className="image-card__meta">{titleVisibilityLabel(image)}</p>
+        {inlineError ? <p className="image-card__inline-error">{inlineError}</p> : null}
+      </div>
+    </article>
+  )
+})
+
 export default function AlbumImageGrid({ campaignId, presentUrl, uploadUrl, initialPresentingImageId, initialImages }) {
   const suppressRenameBlurRef = useRef(false)
   const pendingDeleteRef = useRef(null)
-  const [images, setImages] = useState(initialImages.map(normalizeImage))
+  const [images, setImages] = useState(() => initialImages.map(normalizeImage))
   const [presentingImageId, setPresentingImageId] = useState(initialPresentingImageId)
   const [contextMenu, setContextMenu] = useState(null)
   const [renamingImageId, setRenamingImageId] = useState(null)
-  const [renameValue, setRenameValue] = useState("")
   const [actionError, setActionError] = useState(null)
   const [busyImageIds, setBusyImageIds] = useState({})
+  const imagesById = useMemo(() => new Map(images.map((image) => [image.id, image])), [images])
 
   useEffect(() => {
     setImages(initialImages.map(normalizeImage))
     setPresentingImageId(initialPresentingImageId)
     setContextMenu(null)
     setRenamingImageId(null)
-    setRenameValue("")
     setActionError(null)
     setBusyImageIds({})
     pendingDeleteRef.current = null
@@ -173,25 +205,16 @@ export default function AlbumImageGrid({ campaignId, presentUrl, uploadUrl, init
   useEffect(() => {
     if (!campaignId) return undefined
 
-    const subscription = consumer.subscriptions.create(
-      { channel: "PlayerDisplayChannel", campaign_id: campaignId },
-      {
-        received: (data) => {
-          if (data.cleared) {
-            setPresentingImageId(0)
-            return
-          }
-
-          if (hasOwnKey(data, "image_id")) {
-            setPresentingImageId(Number(data.image_id || 0))
-          }
-        }
+    return subscribeToPlayerDisplay(campaignId, (data) => {
+      if (data.cleared) {
+        setPresentingImageId(0)
+        return
       }
-    )
 
-    return () => {
-      subscription.unsubscribe()
-    }
+      if (hasOwnKey(data, "image_id")) {
+        setPresentingImageId(Number(data.image_id || 0))
+      }
+    })
   }, [campaignId])
 
   useEffect(() => {
@@ -207,11 +230,7 @@ export default function AlbumImageGrid({ campaignId, presentUrl, uploadUrl, init
       setPresentingImageId((currentId) => (currentId === pendingDelete.imageId ? 0 : currentId))
       setContextMenu(null)
       setActionError((currentError) => (currentError?.imageId === pendingDelete.imageId ? null : currentError))
-
-      if (renamingImageId === pendingDelete.imageId) {
-        setRenamingImageId(null)
-        setRenameValue("")
-      }
+      setRenamingImageId((currentId) => (currentId === pendingDelete.imageId ? null : currentId))
     }
 
     function handleDeleteClosed(event) {
@@ -227,7 +246,7 @@ export default function AlbumImageGrid({ campaignId, presentUrl, uploadUrl, init
       document.removeEventListener("record-delete:success", handleDeleteSuccess)
       document.removeEventListener("record-delete:closed", handleDeleteClosed)
     }
-  }, [renamingImageId])
+  }, [])
 
   function setImageBusy(imageId, isBusy) {
     setBusyImageIds((currentBusy) => {
@@ -348,17 +367,15 @@ export default function AlbumImageGrid({ campaignId, presentUrl, uploadUrl, init
     setContextMenu(null)
     clearImageError(image.id)
     setRenamingImageId(image.id)
-    setRenameValue(image.title)
   }
 
   function cancelRename(imageId = renamingImageId) {
     suppressRenameBlurRef.current = false
     if (imageId) clearImageError(imageId)
     setRenamingImageId(null)
-    setRenameValue("")
   }
 
-  async function submitRename(image) {
+  async function submitRename(image, renameValue) {
     if (!image || busyImageIds[image.id]) return
 
     const nextTitle = renameValue.trim()
@@ -428,100 +445,40 @@ export default function AlbumImageGrid({ campaignId, presentUrl, uploadUrl, init
     )
   }
 
-  function renderImageCard(image) {
-    const isPresenting = presentingImageId === image.id
-    const isBusy = Boolean(busyImageIds[image.id])
-    const isRenaming = renamingImageId === image.id
-    const inlineError = actionError?.imageId === image.id ? actionError.message : null
+  const handlersRef = useRef(null)
+  handlersRef.current = { presentImage, submitRename, cancelRename, setContextMenu }
+
+  const cardActions = useMemo(() => ({
+    present: (image) => handlersRef.current.presentImage(image),
+    submitRename: (image, title) => handlersRef.current.submitRename(image, title),
+    cancelRename: (imageId) => handlersRef.current.cancelRename(imageId),
+    openContextMenu: (event, imageId) => {
+      event.preventDefault()
+      event.stopPropagation()
+      handlersRef.current.setContextMenu({
+        x: event.clientX,
+        y: event.clientY,
+        imageId
+      })
+    }
+  }), [])
 
+  function renderImageCard(image) {
     return (
-      <article
-        className="image-card"
+      <ImageCard
         key={image.id}
-        onContextMenu={(event) => {
-          event.preventDefault()
-          event.stopPropagation()
-          setContextMenu({
-            x: event.clientX,
-            y: event.clientY,
-            imageId: image.id
-          })
-        }}
-      >
-        <div className="image-card__thumb-shell">
-          <a href={image.url} className="image-card__thumb-link" data-turbo-frame="content-body">
-            <div className="image-card__thumbnail">
-              {image.previewUrl ? (
-                <img
-                  src={image.previewUrl}
-                  alt={image.title}
-                  className="image-card__preview"
-                  loading="lazy"
-                  decoding="async"
-                />
-              ) : (
-                <div className="image-card__placeholder">No preview available</div>
-              )}
-            </div>
-          </a>
-
-          <button
-            type="button"
-            className={`fantasy-button fantasy-button--primary image-card__present-button ${isPresenting ? "fantasy-button--active is-active" : ""}`.trim()}
-            aria-label={`Present ${image.title}`}
-            aria-pressed={isPresenting ? "true" : "false"}
-            disabled={isBusy}
-            onClick={() => presentImage(image)}
-          >
-            {isPresenting ? "Presenting" : "Present"}
-          </button>
-        </div>
-
-        <div className="image-card__copy">
-          {isRenaming ? (
-            <input
-              type="text"
-              className="image-card__rename-input"
-              value={renameValue}
-              autoFocus
-              disabled={isBusy}
-              onChange={(event) => setRenameValue(event.currentTarget.value)}
-              onFocus={(event) => event.currentTarget.select()}
-              onBlur={() => {
-                if (suppressRenameBlurRef.current) {
-                  suppressRenameBlurRef.current = false
-                  return
-                }
-
-                submitRename(image)
-              }}
-              onKeyDown={(event) => {
-                if (event.key === "Enter") {
-                  event.preventDefault()
-                  submitRename(image)
-                } else if (event.key === "Escape") {
-                  event.preventDefault()
-                  suppressRenameBlurRef.current = true
-                  cancelRename(image.id)
-                }
-              }}
-            />
-          ) : (
-            <h3 className="image-card__title">
-              <a href={image.url} className="card-title-link" data-turbo-frame="content-body">
-                {image.title}
-              </a>
-            </h3>
-          )}
-
-          <p className="image-card__meta">{titleVisibilityLabel(image)}</p>
-          {inlineError ? <p className="image-card__inline-error">{inlineError}</p> : null}
-        </div>
-      </article>
+        image={image}
+        isPresenting={presentingImageId === image.id}
+        isBusy={Boolean(busyImageIds[image.id])}
+        isRenaming={renamingImageId === image.id}
+        inlineError={actionError?.imageId === image.id ? actionError.message : null}
+        suppressRenameBlurRef={suppressRenameBlurRef}
+        actions={cardActions}
+      />
     )
   }
 
-  const contextMenuImage = images.find((image) => image.id === contextMenu?.imageId) || null
+  const contextMenuImage = imagesById.get(contextMenu?.imageId) || null
 
   return (
     <>
@@ -1,8 +1,47 @@
-import React from "react"
+import React, { useMemo, useState } from "react"
 import TreeContextMenu from "./TreeContextMenu"
-import { statusMessage, treeIsEmpty } from "./treeUtils"
+import { indexTreeNodes, statusMessage, treeIsEmpty, treeNodeKey } from "./treeUtils"
 import useTreeState from "./useTreeState"
 
+const RENAME_INPUT_CLASSES = {
+  folder: "tree-rename-input",
+  album: "tree-rename-input tree-rename-input--album"
+}
+
+function TreeRenameInput({ node, nodeType, disabled, suppressBlurRef, onSubmit, onCancel }) {
+  const [value, setValue] = useState(node.name)
+
+  return (
+    <input
+      type="text"
+      className={RENAME_INPUT_CLASSES[nodeType] || RENAME_INPUT_CLASSES.folder}
+      value={value}
+      autoFocus
+      disabled={disabled}
+      onChange={(event) => setValue(event.currentTarget.value)}
+      onBlur={() => {
+        if (suppressBlurRef.current) {
+          suppressBlurRef.current = false
+          return
+        }
+
+        onSubmit(node, nodeType, value)
+      }}
+      onFocus={(event) => event.currentTarget.select()}
+      onKeyDown={(event) => {
+        if (event.key === "Enter") {
+          event.preventDefault()
+          onSubmit(node, nodeType, value)
+        } else if (event.key === "Escape") {
+          event.preventDefault()
+          suppressBlurRef.current = true
+          onCancel()
+        }
+      }}
+    />
+  )
+}
+
 export default function CampaignTree({ treeUrl }) {
   const {
     suppressRenameBlurRef,
@@ -14,11 +53,9 @@ export default function CampaignTree({ treeUrl }) {
     contextMenu,
     renamingNodeId,
     renamingNodeType,
-    renameValue,
     renameError,
     isRenamingSubmitting,
     setContextMenu,
-    setRenameValue,
     toggleFolder,
     navigateTo,
     beginRename,
@@ -29,46 +66,39 @@ export default function CampaignTree({ treeUrl }) {
     handleContextMenuRename,
     handleContextMenuDelete
   } = useTreeState(treeUrl)
+  const nodesByKey = useMemo(() => indexTreeNodes(treeData), [treeData])
+
+  function handleSurfaceContextMenu(event) {
+    const item = event.target.closest("[data-tree-node]")
+    const node = item && nodesByKey.get(item.dataset.treeNode)
+
+    if (node) {
+      handleNodeContextMenu(event, node)
+      return
+    }
+
+    handleTreeBackgroundContextMenu(event)
+  }
 
   function renderTreeLabel(node, nodeType, isCurrent) {
     const isRenaming = renamingNodeId === node.id && renamingNodeType === nodeType
     const inlineError = renameError?.nodeId === node.id && renameError?.nodeType === nodeType ? renameError.message : null
-    const labelClasses = `tree-label ${isCurrent ? "is-current" : ""}`.trim()
 
     return (
       <div className="tree-row__content">
         {isRenaming ? (
-          <input
-            type="text"
-            className={`tree-rename-input ${nodeType === "album" ? "tree-rename-input--album" : ""}`.trim()}
-            value={renameValue}
-            autoFocus
+          <TreeRenameInput
+            node={node}
+            nodeType={nodeType}
             disabled={isRenamingSubmitting}
-            onChange={(event) => setRenameValue(event.currentTarget.value)}
-            onBlur={() => {
-              if (suppressRenameBlurRef.current) {
-                suppressRenameBlurRef.current = false
-                return
-              }
-
-              submitRename(node, nodeType)
-            }}
-            onFocus={(event) => event.currentTarget.select()}
-            onKeyDown={(event) => {
-              if (event.key === "Enter") {
-                event.preventDefault()
-                submitRename(node, nodeType)
-              } else if (event.key === "Escape") {
-                event.preventDefault()
-                suppressRenameBlurRef.current = true
-                cancelRename()
-              }
-            }}
+            suppressBlurRef={suppressRenameBlurRef}
+            onSubmit={submitRename}
+            onCancel={cancelRename}
           />
         ) : (
           <button
             type="button"
-            className={labelClasses}
+            className={isCurrent ? "tree-label is-current" : "tree-label"}
             aria-current={isCurrent ? "page" : undefined}
             onClick={() => navigateTo(node.url)}
             onKeyDown={(event) => {
@@ -98,8 +128,8 @@ export default function CampaignTree({ treeUrl }) {
           return (
             <li
               className="tree-folder tree-item"
-              key={`folder-${childFolder.id}`}
-              onContextMenu={(event) => handleNodeContextMenu(event, childFolder)}
+              key={treeNodeKey(childFolder, "folder")}
+              data-tree-node={treeNodeKey(childFolder, "folder")}
             >
               <div className="tree-row">
                 {hasChildren ? (
@@ -134,8 +164,8 @@ export default function CampaignTree({ treeUrl }) {
           return (
             <li
               className="tree-album tree-item"
-              key={`album-${album.id}`}
-              onContextMenu={(event) => handleNodeContextMenu(event, album)}
+              key={treeNodeKey(album, "album")}
+              data-tree-node={treeNodeKey(album, "album")}
             >
               <div className="tree-row">
                 <span className="tree-spacer" aria-hidden="true" />
@@ -155,7 +185,7 @@ export default function CampaignTree({ treeUrl }) {
   if (loadError && treeData === null) {
     return (
       <div className="tree-surface" onContextMenu={handleTreeBackgroundContextMenu}>
-        {statusMessage("Couldn’t load the tree", "Refresh the page and try again.", "tree-status--error")}
+        {statusMessage("Couldn’t load the tree", "Refresh the page and try again.", "error")}
       </div>
     )
   }
@@ -181,7 +211,7 @@ export default function CampaignTree({ treeUrl }) {
     ? statusMessage(
         "Campaign library is empty",
         "Create a folder or album to start organizing this campaign.",
-        "tree-status--empty"
+        "empty"
       )
     : (
         <nav className="tree-nav" aria-label="Campaign tree">
@@ -192,7 +222,7 @@ export default function CampaignTree({ treeUrl }) {
       )
 
   return (
-    <div className="tree-surface" onContextMenu={handleTreeBackgroundContextMenu}>
+    <div className="tree-surface" onContextMenu={handleSurfaceContextMenu}>
       {content}
       {overlays}
     </div>
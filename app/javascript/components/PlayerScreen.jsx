@@ -1,6 +1,6 @@
 import React, { useEffect, useRef, useState } from "react"
 
-import consumer from "../channels/consumer"
+import { subscribeToPlayerDisplay } from "../channels/player_display_channel"
 
 function buildImage(url, title) {
   if (!url) return null
@@ -15,9 +15,17 @@ function normalizeTransitionType(value) {
   return value === "instant" ? "instant" : "crossfade"
 }
 
+const IMAGE_CLASS = "player-screen__image player-image"
+const IMAGE_TRANSITIONING_CLASS = `${IMAGE_CLASS} transitioning`
+const TITLE_OVERLAY_CLASS = "player-title-overlay"
+const TITLE_OVERLAY_VISIBLE_CLASS = `${TITLE_OVERLAY_CLASS} is-visible`
+
+const CROSSFADE_DURATIONS = new Set([200, 400, 600, 800, 1000])
+const DEFAULT_CROSSFADE_DURATION = 400
+
 function normalizeCrossfadeDuration(value) {
   const duration = Number(value)
-  return [200, 400, 600, 800, 1000].includes(duration) ? duration : 400
+  return CROSSFADE_DURATIONS.has(duration) ? duration : DEFAULT_CROSSFADE_DURATION
 }
 
 function normalizeImageFit(value) {
@@ -37,11 +45,11 @@ export default function PlayerScreen({
   initialCrossfadeDuration,
   initialImageFit
 }) {
-  const [image, setImage] = useState(buildImage(initialImageUrl, initialImageTitle))
+  const [image, setImage] = useState(() => buildImage(initialImageUrl, initialImageTitle))
   const [showTitle, setShowTitle] = useState(initialShowTitle)
-  const [transitionType, setTransitionType] = useState(normalizeTransitionType(initialTransitionType))
-  const [crossfadeDuration, setCrossfadeDuration] = useState(normalizeCrossfadeDuration(initialCrossfadeDuration))
-  const [imageFit, setImageFit] = useState(normalizeImageFit(initialImageFit))
+  const [transitionType, setTransitionType] = useState(() => normalizeTransitionType(initialTransitionType))
+  const [crossfadeDuration, setCrossfadeDuration] = useState(() => normalizeCrossfadeDuration(initialCrossfadeDuration))
+  const [imageFit, setImageFit] = useState(() => normalizeImageFit(initialImageFit))
   const [isTransitioning, setIsTransitioning] = useState(false)
 
   const imageRef = useRef(image)
@@ -73,30 +81,21 @@ export default function PlayerScreen({
   useEffect(() => {
     if (!campaignId) return undefined
 
-    const subscription = consumer.subscriptions.create(
-      { channel: "PlayerDisplayChannel", campaign_id: campaignId },
-      {
-        received(data) {
-          if (data.cleared) {
-            handleClear()
-            return
-          }
-
-          if (hasOwnKey(data, "image_url")) {
-            handlePresent(data)
-            return
-          }
-
-          if (hasOwnKey(data, "show_title")) {
-            setShowTitle(Boolean(data.show_title))
-          }
-        }
+    return subscribeToPlayerDisplay(campaignId, (data) => {
+      if (data.cleared) {
+        handleClear()
+        return
       }
-    )
 
-    return () => {
-      subscription.unsubscribe()
-    }
+      if (hasOwnKey(data, "image_url")) {
+        handlePresent(data)
+        return
+      }
+
+      if (hasOwnKey(data, "show_title")) {
+        setShowTitle(Boolean(data.show_title))
+      }
+    })
   }, [campaignId])
 
   function clearPendingTransition() {
@@ -170,7 +169,7 @@ export default function PlayerScreen({
         <img
           src={image.url}
           alt="Presented artwork"
-          className={`player-screen__image player-image${isTransitioning ? " transitioning" : ""}`}
+          className={isTransitioning ? IMAGE_TRANSITIONING_CLASS : IMAGE_CLASS}
           style={{ objectFit: imageFit, transitionDuration: `${crossfadeDuration}ms` }}
         />
       ) : (
@@ -178,7 +177,7 @@ export default function PlayerScreen({
       )}
 
       {image ? (
-        <div className={`player-title-overlay${showTitle && !isTransitioning ? " is-visible" : ""}`}>
+        <div className={showTitle && !isTransitioning ? TITLE_OVERLAY_VISIBLE_CLASS : TITLE_OVERLAY_CLASS}>
           {image.title}
         </div>
       ) : null}
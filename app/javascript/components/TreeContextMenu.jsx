@@ -1,72 +1,41 @@
-import React, { useEffect, useLayoutEffect, useRef, useState } from "react"
+import React from "react"
 import { createPortal } from "react-dom"
-import usePortalDismiss from "../hooks/usePortalDismiss"
+import useContextMenu from "../hooks/useContextMenu"
+import { visitInContentFrame, workflowUrl } from "../lib/navigation"
 import { inferredNodeType } from "../lib/tree_utils"
 
-const MENU_VIEWPORT_PADDING = 12
-
-function visitInContentFrame(url) {
-  if (!url) return
-
-  if (window.Turbo?.visit) {
-    window.Turbo.visit(url, { frame: "content-body" })
-    return
-  }
-
-  window.location.assign(url)
+const MENU_BUTTON_CLASS = "tree-context-menu__button"
+const MENU_BUTTON_DANGER_CLASS = "tree-context-menu__button tree-context-menu__button--danger"
+
+// `url` names the node field (or root prop) holding the item's target url.
+const MENUS = {
+  root: [
+    { label: "New Folder", action: "workflow", url: "newRootFolderUrl" },
+    { label: "New Album", action: "workflow", url: "newRootAlbumUrl" }
+  ],
+  folder: [
+    { label: "New Subfolder", action: "workflow", url: "new_subfolder_url" },
+    { label: "New Album", action: "workflow", url: "new_album_url" },
+    { label: "Rename", action: "rename" },
+    { label: "Edit", action: "visit", url: "edit_url" },
+    { label: "Delete", action: "delete", danger: true }
+  ],
+  album: [
+    { label: "Rename", action: "rename" },
+    { label: "Edit", action: "visit", url: "edit_url" },
+    { label: "Delete", action: "delete", danger: true }
+  ]
 }
 
-function workflowUrl(url) {
-  if (!url) return url
-
-  const returnTo = `${window.location.pathname}${window.location.search}`
-  const target = new URL(url, window.location.origin)
-  target.searchParams.set("return_to", returnTo)
-
-  return `${target.pathname}${target.search}${target.hash}`
+const MENU_ACTIONS = {
+  rename: ({ rename }) => rename(),
+  delete: ({ remove }) => remove(),
+  workflow: ({ visit }, url) => visit(workflowUrl(url)),
+  visit: ({ visit }, url) => visit(url)
 }
 
 export default function TreeContextMenu({ x, y, node, onClose, onRename, onDelete, newRootFolderUrl, newRootAlbumUrl }) {
-  const menuRef = useRef(null)
-  const [position, setPosition] = useState({ x, y })
-
-  useEffect(() => {
-    setPosition({ x, y })
-  }, [x, y])
-
-  usePortalDismiss({ containerRef: menuRef, onClose })
-
-  useEffect(() => {
-    function handlePointerDown(event) {
-      if (!menuRef.current) return
-      if (menuRef.current.contains(event.target)) return
-      onClose()
-    }
-
-    document.addEventListener("pointerdown", handlePointerDown)
-
-    return () => {
-      document.removeEventListener("pointerdown", handlePointerDown)
-    }
-  }, [onClose])
-
-  useLayoutEffect(() => {
-    if (!menuRef.current) return
-
-    const rect = menuRef.current.getBoundingClientRect()
-    const nextPosition = {
-      x: Math.max(MENU_VIEWPORT_PADDING, Math.min(x, window.innerWidth - rect.width - MENU_VIEWPORT_PADDING)),
-      y: Math.max(MENU_VIEWPORT_PADDING, Math.min(y, window.innerHeight - rect.height - MENU_VIEWPORT_PADDING))
-    }
-
-    setPosition((currentPosition) => {
-      if (currentPosition.x === nextPosition.x && currentPosition.y === nextPosition.y) {
-        return currentPosition
-      }
-
-      return nextPosition
-    })
-  }, [x, y, node, newRootFolderUrl, newRootAlbumUrl])
+  const { menuRef, position } = useContextMenu({ x, y, contentKey: node, onClose })
 
   function handleVisit(url) {
     onClose()
@@ -83,39 +52,16 @@ export default function TreeContextMenu({ x, y, node, onClose, onRename, onDelet
     onDelete(node)
   }
 
-  const nodeType = inferredNodeType(node)
-  let items = []
+  const menuItems = node ? (MENUS[inferredNodeType(node)] || []) : MENUS.root
+  const urlSource = node || { newRootFolderUrl, newRootAlbumUrl }
+
+  function handleSelect(item) {
+    const handlers = { rename: handleRename, remove: handleDelete, visit: handleVisit }
 
-  if (!node) {
-    items = [
-      {
-        label: "New Folder",
-        onSelect: () => handleVisit(workflowUrl(newRootFolderUrl)),
-        disabled: !newRootFolderUrl
-      },
-      {
-        label: "New Album",
-        onSelect: () => handleVisit(workflowUrl(newRootAlbumUrl)),
-        disabled: !newRootAlbumUrl
-      }
-    ]
-  } else if (nodeType === "folder") {
-    items = [
-      { label: "New Subfolder", onSelect: () => handleVisit(workflowUrl(node.new_subfolder_url)) },
-      { label: "New Album", onSelect: () => handleVisit(workflowUrl(node.new_album_url)) },
-      { label: "Rename", onSelect: handleRename },
-      { label: "Edit", onSelect: () => handleVisit(node.edit_url) },
-      { label: "Delete", onSelect: handleDelete, danger: true }
-    ]
-  } else if (nodeType === "album") {
-    items = [
-      { label: "Rename", onSelect: handleRename },
-      { label: "Edit", onSelect: () => handleVisit(node.edit_url) },
-      { label: "Delete", onSelect: handleDelete, danger: true }
-    ]
+    MENU_ACTIONS[item.action](handlers, item.url ? urlSource[item.url] : null)
   }
 
-  if (typeof document === "undefined" || !document.body || items.length === 0) {
+  if (typeof document === "undefined" || !document.body || menuItems.length === 0) {
     return null
   }
 
@@ -132,14 +78,14 @@ export default function TreeContextMenu({ x, y, node, onClose, onRename, onDelet
       }}
     >
       <ul className="tree-context-menu__list">
-        {items.map((item) => (
+        {menuItems.map((item) => (
           <li key={item.label} className="tree-context-menu__item">
             <button
               type="button"
               role="menuitem"
-              disabled={item.disabled}
-              className={`tree-context-menu__button ${item.danger ? "tree-context-menu__button--danger" : ""}`.trim()}
-              onClick={item.onSelect}
+              disabled={!node && !urlSource[item.url]}
+              className={item.danger ? MENU_BUTTON_DANGER_CLASS : MENU_BUTTON_CLASS}
+              onClick={() => handleSelect(item)}
             >
               {item.label}
             </button>
@@ -1,6 +1,7 @@
 import React from "react"
 
-export { csrfToken, inferredNodeType } from "../lib/tree_utils"
+export { csrfToken } from "../lib/csrf"
+export { inferredNodeType } from "../lib/tree_utils"
 
 export function storageKeyFor(campaignId) {
   return `campaign-tree:${campaignId}:expanded`
@@ -8,14 +9,22 @@ export function storageKeyFor(campaignId) {
 
 export function loadExpandedState(campaignId) {
   try {
-    return JSON.parse(sessionStorage.getItem(storageKeyFor(campaignId)) || "{}")
+    const stored = JSON.parse(sessionStorage.getItem(storageKeyFor(campaignId)) || "[]")
+    if (Array.isArray(stored)) return Object.fromEntries(stored.map((folderId) => [folderId, true]))
+
+    return stored && typeof stored === "object" ? stored : {}
   } catch {
     return {}
   }
 }
 
 export function saveExpandedState(campaignId, expanded) {
-  sessionStorage.setItem(storageKeyFor(campaignId), JSON.stringify(expanded))
+  const key = storageKeyFor(campaignId)
+  const serialized = JSON.stringify(Object.keys(expanded).filter((folderId) => expanded[folderId]))
+
+  if (sessionStorage.getItem(key) === serialized) return
+
+  sessionStorage.setItem(key, serialized)
 }
 
 export function readBreadcrumbUrls() {
@@ -26,44 +35,211 @@ export function readBreadcrumbUrls() {
   if (!payloadElement) return []
 
   try {
-    return JSON.parse(payloadElement.dataset.breadcrumbsPayload || "[]")
-      .map(([, url]) => url)
-      .filter(Boolean)
+    const urls = []
+
+    for (const [, url] of JSON.parse(payloadElement.dataset.breadcrumbsPayload || "[]")) {
+      if (url) urls.push(url)
+    }
+
+    return urls
   } catch {
     return []
   }
 }
 
 export function currentTreeContext() {
+  const breadcrumbUrls = readBreadcrumbUrls()
+
   return {
     path: window.location.pathname,
     fullPath: `${window.location.pathname}${window.location.search}`,
-    breadcrumbUrls: readBreadcrumbUrls()
+    breadcrumbUrls,
+    breadcrumbUrlSet: new Set(breadcrumbUrls)
   }
 }
 
+export function treeContextsMatch(left, right) {
+  if (left.fullPath !== right.fullPath) return false
+  if (left.breadcrumbUrls.length !== right.breadcrumbUrls.length) return false
+
+  return left.breadcrumbUrls.every((url, index) => right.breadcrumbUrls[index] === url)
+}
+
 export function treeIsEmpty(folder) {
   return folder.folders.length === 0 && folder.albums.length === 0
 }
 
-export function findExpandedPath(folder, targetUrl) {
-  if (!targetUrl) return null
-  if (folder.url === targetUrl) return []
+export function reconcileTree(previous, next) {
+  if (previous === next) return previous
+  if (typeof previous !== "object" || previous === null) return next
+  if (typeof next !== "object" || next === null) return next
+  if (Array.isArray(previous) !== Array.isArray(next)) return next
+
+  if (Array.isArray(next)) {
+    const previousById = new Map(previous.map((entry) => [entry?.id, entry]))
+    let changed = previous.length !== next.length
+    const reconciled = next.map((entry, index) => {
+      const value = reconcileTree(previousById.get(entry?.id), entry)
+      if (value !== previous[index]) changed = true
+      return value
+    })
+
+    return changed ? reconciled : previous
+  }
+
+  const keys = Object.keys(next)
+  let changed = keys.length !== Object.keys(previous).length
+  const reconciled = {}
+
+  for (const key of keys) {
+    reconciled[key] = reconcileTree(previous[key], next[key])
+    if (reconciled[key] !== previous[key]) changed = true
+  }
+
+  return changed ? reconciled : previous
+}
+
+export function removeTreeNode(folder, nodeType, nodeId) {
+  if (nodeType === "album") {
+    const album = folder.albums.find((candidate) => candidate.id === nodeId)
+
+    if (album) {
+      return {
+        ...folder,
+        albums: folder.albums.filter((candidate) => candidate !== album),
+        album_count: Number(folder.album_count || 0) - 1,
+        image_count: Number(folder.image_count || 0) - Number(album.image_count || 0)
+      }
+    }
+  } else if (folder.folders.some((candidate) => candidate.id === nodeId)) {
+    return {
+      ...folder,
+      folders: folder.folders.filter((candidate) => candidate.id !== nodeId),
+      child_folder_count: Number(folder.child_folder_count || 0) - 1
+    }
+  }
+
+  let changed = false
+  const folders = folder.folders.map((childFolder) => {
+    const nextFolder = removeTreeNode(childFolder, nodeType, nodeId)
+    if (nextFolder !== childFolder) changed = true
+    return nextFolder
+  })
+
+  return changed ? { ...folder, folders } : folder
+}
+
+function compareValues(left, right) {
+  if (left < right) return -1
+  if (left > right) return 1
+  return 0
+}
+
+function naturalNameKey(name) {
+  return Array.from(name.toLowerCase().matchAll(/(\d+)|(\D+)/g), ([, digits, text]) => (
+    digits ? [0, Number(digits)] : [1, text]
+  ))
+}
+
+// Mirrors NaturalNameSort on the server.
+export function compareNaturalNames(left, right) {
+  const leftKey = naturalNameKey(left)
+  const rightKey = naturalNameKey(right)
+
+  for (let index = 0; index < Math.min(leftKey.length, rightKey.length); index += 1) {
+    const result = compareValues(leftKey[index][0], rightKey[index][0]) ||
+      compareValues(leftKey[index][1], rightKey[index][1])
+    if (result !== 0) return result
+  }
+
+  return compareValues(leftKey.length, rightKey.length) ||
+    compareValues(left.toLowerCase(), right.toLowerCase()) ||
+    compareValues(left, right)
+}
+
+function moveToSortedSlot(nodes, node) {
+  const siblings = nodes.filter((candidate) => candidate.id !== node.id)
+  const index = siblings.findIndex((sibling) => compareNaturalNames(node.name, sibling.name) < 0)
+
+  siblings.splice(index === -1 ? siblings.length : index, 0, node)
+  return siblings
+}
+
+export function renameTreeNode(folder, nodeType, nodeId, attributes) {
+  const key = nodeType === "folder" ? "folders" : "albums"
+  const node = folder[key].find((candidate) => candidate.id === nodeId)
+
+  if (node) {
+    return { ...folder, [key]: moveToSortedSlot(folder[key], { ...node, ...attributes }) }
+  }
 
-  for (const childFolder of folder.folders) {
-    if (childFolder.url === targetUrl) return [childFolder.id]
+  let changed = false
+  const folders = folder.folders.map((childFolder) => {
+    const nextFolder = renameTreeNode(childFolder, nodeType, nodeId, attributes)
+    if (nextFolder !== childFolder) changed = true
+    return nextFolder
+  })
+
+  return changed ? { ...folder, folders } : folder
+}
+
+const expandedPathIndexes = new WeakMap()
+
+function expandedPathIndex(tree) {
+  const cachedIndex = expandedPathIndexes.get(tree)
+  if (cachedIndex) return cachedIndex
+
+  const index = new Map([[tree.url, []]])
+  const pending = [[tree, []]]
+
+  while (pending.length > 0) {
+    const [folder, folderPath] = pending.pop()
+
+    for (const album of folder.albums) {
+      if (!index.has(album.url)) index.set(album.url, folderPath)
+    }
 
-    const descendantPath = findExpandedPath(childFolder, targetUrl)
-    if (descendantPath !== null) {
-      return [childFolder.id, ...descendantPath]
+    for (const childFolder of folder.folders) {
+      const childPath = [...folderPath, childFolder.id]
+      if (!index.has(childFolder.url)) index.set(childFolder.url, childPath)
+      pending.push([childFolder, childPath])
     }
   }
 
-  for (const album of folder.albums) {
-    if (album.url === targetUrl) return []
+  expandedPathIndexes.set(tree, index)
+  return index
+}
+
+export function treeNodeKey(node, nodeType) {
+  return `${nodeType}-${node.id}`
+}
+
+export function indexTreeNodes(tree) {
+  const index = new Map()
+  if (!tree) return index
+
+  const pending = [tree]
+
+  while (pending.length > 0) {
+    const folder = pending.pop()
+
+    for (const album of folder.albums) {
+      index.set(treeNodeKey(album, "album"), album)
+    }
+
+    for (const childFolder of folder.folders) {
+      index.set(treeNodeKey(childFolder, "folder"), childFolder)
+      pending.push(childFolder)
+    }
   }
 
-  return null
+  return index
+}
+
+export function findExpandedPath(folder, targetUrl) {
+  if (!targetUrl) return null
+
+  return expandedPathIndex(folder).get(targetUrl) ?? null
 }
 
 export function requiredExpandedState(folder, context) {
@@ -88,10 +264,16 @@ export function expandedStatesMatch(left, right) {
   return leftEntries.every(([key, value]) => right[key] === value)
 }
 
-export function statusMessage(title, body, modifier = "") {
+const STATUS_CLASSES = {
+  default: "tree-status",
+  empty: "tree-status tree-status--empty",
+  error: "tree-status tree-status--error"
+}
+
+export function statusMessage(title, body, variant = "default") {
   return React.createElement(
     "div",
-    { className: `tree-status ${modifier}`.trim() },
+    { className: STATUS_CLASSES[variant] || STATUS_CLASSES.default },
     React.createElement("p", { className: "tree-status__title" }, title),
     body ? React.createElement("p", { className: "tree-status__body" }, body) : null
   )
@@ -1,19 +1,24 @@
-import { useEffect, useRef, useState } from "react"
+import { startTransition, useEffect, useRef, useState } from "react"
 import {
   csrfToken,
   currentTreeContext,
   expandedStatesMatch,
   inferredNodeType,
   loadExpandedState,
+  reconcileTree,
+  removeTreeNode,
   renameErrorMessage,
+  renameTreeNode,
   renamePayloadFor,
   requiredExpandedState,
-  saveExpandedState
+  saveExpandedState,
+  treeContextsMatch
 } from "./treeUtils"
 
 export default function useTreeState(treeUrl) {
   const suppressRenameBlurRef = useRef(false)
   const pendingDeleteRef = useRef(null)
+  const renameInFlightRef = useRef(false)
   const [treeData, setTreeData] = useState(null)
   const [expanded, setExpanded] = useState({})
   const [currentContext, setCurrentContext] = useState(currentTreeContext)
@@ -22,13 +27,13 @@ export default function useTreeState(treeUrl) {
   const [contextMenu, setContextMenu] = useState(null)
   const [renamingNodeId, setRenamingNodeId] = useState(null)
   const [renamingNodeType, setRenamingNodeType] = useState(null)
-  const [renameValue, setRenameValue] = useState("")
   const [renameError, setRenameError] = useState(null)
   const [isRenamingSubmitting, setIsRenamingSubmitting] = useState(false)
 
   useEffect(() => {
     let cancelled = false
     let activeController = null
+    let expandedStateLoaded = false
 
     async function loadTree() {
       try {
@@ -37,7 +42,7 @@ export default function useTreeState(treeUrl) {
 
         const response = await fetch(treeUrl, {
           headers: { Accept: "application/json" },
-          cache: "no-store",
+          cache: "no-cache",
           signal: activeController.signal
         })
         if (!response.ok) throw new Error(`Tree request failed with ${response.status}`)
@@ -45,10 +50,15 @@ export default function useTreeState(treeUrl) {
         const data = await response.json()
         if (cancelled) return
 
-        setTreeData(data)
-        setExpanded(loadExpandedState(data.campaignId))
-        setLoadError(false)
-        setHasLoaded(true)
+        const restoreExpanded = !expandedStateLoaded
+        expandedStateLoaded = true
+
+        startTransition(() => {
+          setTreeData((currentData) => reconcileTree(currentData, data))
+          if (restoreExpanded) setExpanded(loadExpandedState(data.campaignId))
+          setLoadError(false)
+          setHasLoaded(true)
+        })
       } catch {
         if (activeController?.signal.aborted || cancelled) return
         if (cancelled) return
@@ -58,9 +68,16 @@ export default function useTreeState(treeUrl) {
       }
     }
 
+    let refreshFrame = null
+
     function refreshTree() {
       setContextMenu(null)
-      loadTree()
+      if (refreshFrame !== null) return
+
+      refreshFrame = window.requestAnimationFrame(() => {
+        refreshFrame = null
+        loadTree()
+      })
     }
 
     loadTree()
@@ -69,14 +86,24 @@ export default function useTreeState(treeUrl) {
     return () => {
       cancelled = true
       activeController?.abort()
+      if (refreshFrame !== null) window.cancelAnimationFrame(refreshFrame)
       document.removeEventListener("tree:refresh", refreshTree)
     }
   }, [treeUrl])
 
   useEffect(() => {
+    let syncFrame = null
+
     function syncCurrentContext(event) {
       if (event?.target?.id && event.target.id !== "content-body") return
-      setCurrentContext(currentTreeContext())
+      if (syncFrame !== null) return
+
+      syncFrame = window.requestAnimationFrame(() => {
+        syncFrame = null
+        const nextContext = currentTreeContext()
+
+        setCurrentContext((context) => (treeContextsMatch(context, nextContext) ? context : nextContext))
+      })
     }
 
     document.addEventListener("turbo:frame-load", syncCurrentContext)
@@ -84,6 +111,7 @@ export default function useTreeState(treeUrl) {
     window.addEventListener("popstate", syncCurrentContext)
 
     return () => {
+      if (syncFrame !== null) window.cancelAnimationFrame(syncFrame)
       document.removeEventListener("turbo:frame-load", syncCurrentContext)
       document.removeEventListener("turbo:load", syncCurrentContext)
       window.removeEventListener("popstate", syncCurrentContext)
@@ -104,23 +132,25 @@ export default function useTreeState(treeUrl) {
 
       if (expandedStatesMatch(currentExpanded, nextExpanded)) return currentExpanded
 
-      saveExpandedState(treeData.campaignId, nextExpanded)
       return nextExpanded
     })
   }, [treeData, currentContext])
 
+  const campaignId = treeData?.campaignId
+
+  useEffect(() => {
+    if (campaignId == null) return
+
+    saveExpandedState(campaignId, expanded)
+  }, [campaignId, expanded])
+
   function toggleFolder(folderId) {
     if (!treeData) return
 
-    setExpanded((currentExpanded) => {
-      const nextExpanded = {
-        ...currentExpanded,
-        [folderId]: !currentExpanded[folderId]
-      }
-
-      saveExpandedState(treeData.campaignId, nextExpanded)
-      return nextExpanded
-    })
+    setExpanded((currentExpanded) => ({
+      ...currentExpanded,
+      [folderId]: !currentExpanded[folderId]
+    }))
   }
 
   function navigateTo(url) {
@@ -128,8 +158,15 @@ export default function useTreeState(treeUrl) {
     window.Turbo.visit(url, { frame: "content-body" })
   }
 
-  function dispatchTreeRefresh() {
-    document.dispatchEvent(new CustomEvent("tree:refresh"))
+  function renamedNodeAttributes(nodeType, responseBody) {
+    const attributes = {
+      name: responseBody.name,
+      url: responseBody.url,
+      edit_url: responseBody.edit_url
+    }
+
+    if (nodeType === "folder") attributes.new_subfolder_url = responseBody.new_subfolder_url
+    return attributes
   }
 
   function deleteRequestId() {
@@ -159,7 +196,7 @@ export default function useTreeState(treeUrl) {
   function pageDependsOnNode(node) {
     if (!node?.url) return false
 
-    return currentContext.path === node.url || currentContext.breadcrumbUrls.includes(node.url)
+    return currentContext.path === node.url || currentContext.breadcrumbUrlSet.has(node.url)
   }
 
   function refreshCurrentViewForRenamedNode(node, responseBody) {
@@ -187,22 +224,28 @@ export default function useTreeState(treeUrl) {
     setRenameError(null)
     setRenamingNodeId(node.id)
     setRenamingNodeType(nodeType)
-    setRenameValue(node.name)
     setIsRenamingSubmitting(false)
   }
 
   function clearRenameState() {
     setRenamingNodeId(null)
     setRenamingNodeType(null)
-    setRenameValue("")
     setIsRenamingSubmitting(false)
   }
 
-  async function submitRename(node, nodeType) {
-    if (isRenamingSubmitting) return
+  async function submitRename(node, nodeType, renameValue) {
+    // Enter and the blur that follows it can both submit before state updates.
+    if (renameInFlightRef.current) return
 
     setRenameError(null)
     setContextMenu(null)
+
+    if (renameValue.trim() === node.name) {
+      clearRenameState()
+      return
+    }
+
+    renameInFlightRef.current = true
     setIsRenamingSubmitting(true)
 
     try {
@@ -230,7 +273,12 @@ export default function useTreeState(treeUrl) {
         return
       }
 
-      dispatchTreeRefresh()
+      setTreeData((currentData) => currentData && renameTreeNode(
+        currentData,
+        nodeType,
+        node.id,
+        renamedNodeAttributes(nodeType, responseBody)
+      ))
       refreshCurrentViewForRenamedNode(node, responseBody)
       clearRenameState()
     } catch {
@@ -240,6 +288,8 @@ export default function useTreeState(treeUrl) {
         message: "Couldn’t rename this item."
       })
       clearRenameState()
+    } finally {
+      renameInFlightRef.current = false
     }
   }
 
@@ -293,6 +343,9 @@ export default function useTreeState(treeUrl) {
     }))
   }
 
+  const redirectForDeletedNodeRef = useRef(null)
+  redirectForDeletedNodeRef.current = redirectCurrentViewForDeletedNode
+
   useEffect(() => {
     function handleDeleteSuccess(event) {
       const pendingDelete = pendingDeleteRef.current
@@ -300,8 +353,12 @@ export default function useTreeState(treeUrl) {
       if (event.detail?.requestId !== pendingDelete.requestId) return
 
       pendingDeleteRef.current = null
-      dispatchTreeRefresh()
-      redirectCurrentViewForDeletedNode(pendingDelete.node, event.detail?.responseBody)
+      setTreeData((currentData) => currentData && removeTreeNode(
+        currentData,
+        inferredNodeType(pendingDelete.node),
+        pendingDelete.node.id
+      ))
+      redirectForDeletedNodeRef.current(pendingDelete.node, event.detail?.responseBody)
     }
 
     function handleDeleteClosed(event) {
@@ -317,7 +374,7 @@ export default function useTreeState(treeUrl) {
       document.removeEventListener("record-delete:success", handleDeleteSuccess)
       document.removeEventListener("record-delete:closed", handleDeleteClosed)
     }
-  }, [currentContext])
+  }, [])
 
   return {
     suppressRenameBlurRef,
@@ -329,11 +386,9 @@ export default function useTreeState(treeUrl) {
     contextMenu,
     renamingNodeId,
     renamingNodeType,
-    renameValue,
     renameError,
     isRenamingSubmitting,
     setContextMenu,
-    setRenameValue,
     toggleFolder,
     navigateTo,
     beginRename,
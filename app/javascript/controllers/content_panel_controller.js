@@ -11,7 +11,11 @@ export default class extends Controller {
     const frame = this.findFrame(event)
     if (!frame) return
 
-    const items = this.parseBreadcrumbs(this.findBreadcrumbsPayload(frame))
+    const rawBreadcrumbs = this.findBreadcrumbsPayload(frame)
+    if (this.renderedBreadcrumbs !== undefined && rawBreadcrumbs === this.renderedBreadcrumbs) return
+
+    this.renderedBreadcrumbs = rawBreadcrumbs
+    const items = this.parseBreadcrumbs(rawBreadcrumbs)
     this.breadcrumbsTarget.replaceChildren()
 
     if (items.length === 0) return
@@ -1,5 +1,6 @@
 import { Controller } from "@hotwired/stimulus"
-import consumer from "../channels/consumer"
+import { subscribeToPlayerDisplay } from "../channels/player_display_channel"
+import { csrfToken } from "../lib/csrf"
 
 export default class extends Controller {
   static values = {
@@ -27,7 +28,7 @@ export default class extends Controller {
     if (!imageId) return
 
     await this.submit(button, this.presentUrlValue, { current_image_id: imageId }, () => {
-      this.presentingImageIdValue = imageId
+      this.showPresentingImage(imageId)
     })
   }
 
@@ -37,7 +38,7 @@ export default class extends Controller {
     if (!this.hasClearUrlValue) return
 
     await this.submit(event.currentTarget, this.clearUrlValue, {}, () => {
-      this.presentingImageIdValue = 0
+      this.showPresentingImage(0)
     })
   }
 
@@ -53,7 +54,7 @@ export default class extends Controller {
         headers: {
           "Accept": "text/vnd.turbo-stream.html",
           "Content-Type": "application/json",
-          "X-CSRF-Token": this.csrfToken,
+          "X-CSRF-Token": csrfToken(),
           "X-Requested-With": "XMLHttpRequest"
         },
         credentials: "same-origin",
@@ -77,28 +78,49 @@ export default class extends Controller {
     } finally {
       button.disabled = previouslyDisabled
       button.classList.remove("is-busy")
-      this.syncButtons()
+      this.syncClearButtons()
     }
   }
 
+  showPresentingImage(imageId) {
+    const previousImageId = this.presentingImageIdValue || 0
+    if (previousImageId === imageId) return
+
+    this.presentingImageIdValue = imageId
+    this.syncImageButtons(`[data-player-display-image-id="${previousImageId}"]`)
+    this.syncImageButtons(`[data-player-display-image-id="${imageId}"]`)
+    this.syncClearButtons()
+  }
+
   syncButtons() {
+    this.syncImageButtons("[data-player-display-image-id]")
+    this.syncClearButtons()
+  }
+
+  syncImageButtons(selector) {
     const presentingImageId = this.presentingImageIdValue || 0
     const hasPresentedImage = presentingImageId > 0
 
-    this.element.querySelectorAll("[data-player-display-image-id]").forEach((button) => {
+    this.element.querySelectorAll(selector).forEach((button) => {
       const imageId = Number(button.dataset.playerDisplayImageId)
       const isActive = hasPresentedImage && imageId === presentingImageId
       const activeLabel = button.dataset.playerDisplayActiveLabel || "Presenting"
       const inactiveLabel = button.dataset.playerDisplayInactiveLabel || "Present"
+      const label = isActive ? activeLabel : inactiveLabel
+      const pressed = isActive ? "true" : "false"
 
-      button.textContent = isActive ? activeLabel : inactiveLabel
+      if (button.textContent !== label) button.textContent = label
+      if (button.getAttribute("aria-pressed") !== pressed) button.setAttribute("aria-pressed", pressed)
       button.classList.toggle("fantasy-button--active", isActive)
       button.classList.toggle("is-active", isActive)
-      button.setAttribute("aria-pressed", isActive ? "true" : "false")
     })
+  }
+
+  syncClearButtons() {
+    const hasPresentedImage = (this.presentingImageIdValue || 0) > 0
 
     this.element.querySelectorAll("[data-player-display-clear]").forEach((button) => {
-      button.disabled = !hasPresentedImage
+      if (button.disabled === hasPresentedImage) button.disabled = !hasPresentedImage
       button.classList.toggle("fantasy-button--disabled", !hasPresentedImage)
     })
   }
@@ -108,30 +130,19 @@ export default class extends Controller {
 
     this.unsubscribeFromPlayerDisplay()
 
-    this.subscription = consumer.subscriptions.create(
-      { channel: "PlayerDisplayChannel", campaign_id: this.campaignIdValue },
-      {
-        received: (data) => {
-          if (data.cleared) {
-            this.presentingImageIdValue = 0
-          } else {
-            this.presentingImageIdValue = Number(data.image_id || 0)
-          }
-
-          this.syncButtons()
-        }
+    this.unsubscribe = subscribeToPlayerDisplay(this.campaignIdValue, (data) => {
+      if (data.cleared) {
+        this.showPresentingImage(0)
+      } else if (Object.prototype.hasOwnProperty.call(data, "image_id")) {
+        this.showPresentingImage(Number(data.image_id || 0))
       }
-    )
+    })
   }
 
   unsubscribeFromPlayerDisplay() {
-    if (!this.subscription) return
-
-    this.subscription.unsubscribe()
-    this.subscription = null
-  }
+    if (!this.unsubscribe) return
 
-  get csrfToken() {
-    return document.querySelector('meta[name="csrf-token"]')?.content || ""
+    this.unsubscribe()
+    this.unsubscribe = null
   }
 }
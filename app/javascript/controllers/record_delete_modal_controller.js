@@ -1,5 +1,5 @@
 import { Controller } from "@hotwired/stimulus"
-import { csrfToken } from "../lib/tree_utils"
+import { csrfToken } from "../lib/csrf"
 
 export default class extends Controller {
   static targets = ["modal", "card", "title", "name", "body", "error", "confirm"]
@@ -137,14 +137,14 @@ export default class extends Controller {
     this.nameTarget.textContent = name
     this.nameTarget.hidden = name.length === 0
 
-    this.bodyTarget.replaceChildren()
-
-    for (const line of payload.descriptionLines || []) {
+    const paragraphs = (payload.descriptionLines || []).map((line) => {
       const paragraph = document.createElement("p")
       paragraph.className = "tree-delete-modal__line"
       paragraph.textContent = line
-      this.bodyTarget.append(paragraph)
-    }
+      return paragraph
+    })
+
+    this.bodyTarget.replaceChildren(...paragraphs)
   }
 
   handleSuccessfulDelete(responseBody) {
@@ -1,31 +1,39 @@
 import React from "react"
 import { createRoot } from "react-dom/client"
 
-import AlbumImageGrid from "../components/AlbumImageGrid"
-import CampaignTree from "../components/CampaignTree"
-import PlayerScreen from "../components/PlayerScreen"
-
 const roots = new WeakMap()
 
-function mountRoot(id, render) {
+const loadAlbumImageGrid = () => import("../components/AlbumImageGrid")
+const loadCampaignTree = () => import("../components/CampaignTree")
+const loadPlayerScreen = () => import("../components/PlayerScreen")
+
+function mountRoot(id, load, render) {
   const element = document.getElementById(id)
   if (!element) return
 
-  let root = roots.get(element)
-  if (!root) {
-    root = createRoot(element)
-    roots.set(element, root)
-  }
+  load()
+    .then(({ default: Component }) => {
+      if (!element.isConnected) return
 
-  root.render(render(element))
+      let root = roots.get(element)
+      if (!root) {
+        root = createRoot(element)
+        roots.set(element, root)
+      }
+
+      root.render(render(element, Component))
+    })
+    .catch((error) => {
+      window.console.error(`Couldn't load the component for #${id}`, error)
+    })
 }
 
 function mountCampaignTree() {
-  mountRoot("campaign-tree", (element) => <CampaignTree treeUrl={element.dataset.treeUrl} />)
+  mountRoot("campaign-tree", loadCampaignTree, (element, CampaignTree) => <CampaignTree treeUrl={element.dataset.treeUrl} />)
 }
 
 function mountPlayerScreen() {
-  mountRoot("player-screen", (element) => (
+  mountRoot("player-screen", loadPlayerScreen, (element, PlayerScreen) => (
     <PlayerScreen
       campaignId={element.dataset.campaignId}
       initialImageUrl={element.dataset.initialImage || element.dataset.imageUrl || null}
@@ -47,21 +55,35 @@ function parseAlbumImagePayload(value) {
   }
 }
 
+const albumImagePayloads = new WeakMap()
+
+function albumImagePayloadFor(element) {
+  const value = element.dataset.imagesPayload
+  const cached = albumImagePayloads.get(element)
+  if (cached?.value === value) return cached.payload
+
+  const payload = parseAlbumImagePayload(value)
+  albumImagePayloads.set(element, { value, payload })
+  return payload
+}
+
 function mountAlbumImageGrid() {
-  mountRoot("album-image-grid", (element) => (
+  mountRoot("album-image-grid", loadAlbumImageGrid, (element, AlbumImageGrid) => (
     <AlbumImageGrid
       campaignId={Number(element.dataset.campaignId || 0)}
       presentUrl={element.dataset.presentUrl || ""}
       uploadUrl={element.dataset.uploadUrl || ""}
       initialPresentingImageId={Number(element.dataset.initialPresentingImageId || 0)}
-      initialImages={parseAlbumImagePayload(element.dataset.imagesPayload)}
+      initialImages={albumImagePayloadFor(element)}
     />
   ))
 }
 
-document.addEventListener("turbo:load", mountCampaignTree)
-document.addEventListener("turbo:load", mountAlbumImageGrid)
-document.addEventListener("turbo:load", mountPlayerScreen)
-mountCampaignTree()
-mountAlbumImageGrid()
-mountPlayerScreen()
+function mountAll() {
+  mountCampaignTree()
+  mountAlbumImageGrid()
+  mountPlayerScreen()
+}
+
+document.addEventListener("turbo:load", mountAll)
+mountAll()
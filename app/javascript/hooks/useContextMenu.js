@@ -0,0 +1,47 @@
+import { useEffect, useLayoutEffect, useRef, useState } from "react"
+
+import usePortalDismiss from "./usePortalDismiss"
+
+const MENU_VIEWPORT_PADDING = 12
+
+// `contentKey` should change whenever the menu's items, and so its size, do.
+export default function useContextMenu({ x, y, contentKey, onClose }) {
+  const menuRef = useRef(null)
+  const [position, setPosition] = useState({ x, y })
+
+  usePortalDismiss({ containerRef: menuRef, onClose })
+
+  useEffect(() => {
+    function handlePointerDown(event) {
+      if (!menuRef.current) return
+      if (menuRef.current.contains(event.target)) return
+      onClose()
+    }
+
+    document.addEventListener("pointerdown", handlePointerDown)
+
+    return () => {
+      document.removeEventListener("pointerdown", handlePointerDown)
+    }
+  }, [onClose])
+
+  useLayoutEffect(() => {
+    if (!menuRef.current) return
+
+    const rect = menuRef.current.getBoundingClientRect()
+    const nextPosition = {
+      x: Math.max(MENU_VIEWPORT_PADDING, Math.min(x, window.innerWidth - rect.width - MENU_VIEWPORT_PADDING)),
+      y: Math.max(MENU_VIEWPORT_PADDING, Math.min(y, window.innerHeight - rect.height - MENU_VIEWPORT_PADDING))
+    }
+
+    setPosition((currentPosition) => {
+      if (currentPosition.x === nextPosition.x && currentPosition.y === nextPosition.y) {
+        return currentPosition
+      }
+
+      return nextPosition
+    })
+  }, [x, y, contentKey])
+
+  return { menuRef, position }
+}
@@ -0,0 +1,20 @@
+export function visitInContentFrame(url) {
+  if (!url) return
+
+  if (window.Turbo?.visit) {
+    window.Turbo.visit(url, { frame: "content-body" })
+    return
+  }
+
+  window.location.assign(url)
+}
+
+export function workflowUrl(url) {
+  if (!url) return url
+
+  const returnTo = `${window.location.pathname}${window.location.search}`
+  const target = new URL(url, window.location.origin)
+  target.searchParams.set("return_to", returnTo)
+
+  return `${target.pathname}${target.search}${target.hash}`
+}
@@ -4,7 +4,3 @@ export function inferredNodeType(node) {
   if (Array.isArray(node.folders) && Array.isArray(node.albums)) return "folder"
   return "album"
 }
-
-export function csrfToken() {
-  return document.querySelector('meta[name="csrf-token"]')?.content || ""
-}
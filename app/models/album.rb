@@ -1,4 +1,6 @@
 class Album < ApplicationRecord
+  include SelectedCounts
+
   belongs_to :campaign
   belongs_to :folder
 
@@ -6,7 +8,15 @@ class Album < ApplicationRecord
 
   validates :name, presence: true
 
+  scope :with_image_count, ->(columns = "albums.*") {
+    left_outer_joins(:images)
+      .select(*Array(columns), "COUNT(images.id) AS image_count")
+      .group("albums.id")
+  }
+
+  selected_count :image_count, :images
+
   def to_param
-    "#{id}-#{name.squish.parameterize}"
+    "#{id}-#{name.parameterize}"
   end
 end
@@ -5,7 +5,7 @@ class Campaign < ApplicationRecord
 
   has_one :root_folder, -> { where(is_root: true) }, class_name: "Folder", dependent: :destroy
   has_one :player_display, dependent: :destroy
-  has_many :presentation_events, dependent: :destroy
+  has_many :presentation_events, dependent: :delete_all
   has_many :folders, dependent: :destroy
   has_many :albums, dependent: :destroy
   has_many :images, dependent: :destroy
@@ -15,7 +15,7 @@ class Campaign < ApplicationRecord
   after_create :create_root_folder!
 
   def to_param
-    "#{id}-#{name.squish.parameterize}"
+    "#{id}-#{name.parameterize}"
   end
 
   def create_root_folder!
@@ -0,0 +1,16 @@
+module SelectedCounts
+  extend ActiveSupport::Concern
+
+  class_methods do
+    # Defines a reader that uses the count selected under the same name when
+    # the query included one, so listings avoid a COUNT query per record, and
+    # otherwise counts the association.
+    def selected_count(name, association)
+      define_method(name) do
+        return read_attribute(name).to_i if has_attribute?(name)
+
+        public_send(association).size
+      end
+    end
+  end
+end
@@ -1,4 +1,6 @@
 class Folder < ApplicationRecord
+  include SelectedCounts
+
   belongs_to :campaign
   belongs_to :parent, class_name: "Folder", optional: true
 
@@ -7,32 +9,61 @@ class Folder < ApplicationRecord
 
   validates :name, presence: true
   # Make sure we don't mix folders in different campaigns
-  validates :parent, presence: true, unless: :is_root?
+  validates :parent, presence: true, unless: -> { is_root? || placement_unchanged? }
   validate :folder_parent_from_same_campaign
   # Make sure that there is one root for the campaign and that it has no parent.
   validates :is_root, inclusion: { in: [ true, false ] }
-  validates :is_root, uniqueness: { scope: :campaign_id }, if: :is_root?
+  validates :is_root, uniqueness: { scope: :campaign_id }, if: -> { is_root? && !placement_unchanged? }
   validate :root_folder_has_no_parent
 
+  scope :with_child_counts, -> {
+    select(
+      "folders.*",
+      "(SELECT COUNT(*) FROM folders child_folders WHERE child_folders.parent_id = folders.id) AS child_folder_count",
+      "(SELECT COUNT(*) FROM albums WHERE albums.folder_id = folders.id) AS album_count"
+    )
+  }
+
+  selected_count :child_folder_count, :child_folders
+  selected_count :album_count, :albums
+
+  # Returns the folders from the top-most non-root ancestor through self. The
+  # parent chain is resolved in a single recursive query rather than one query
+  # per level.
   def ancestry
-    lineage = []
-    current = self
+    return [] if is_root?
+    return [ self ] if parent_id.blank?
 
-    while current.present?
-      lineage.unshift(current) unless current.is_root?
-      current = current.parent
-    end
+    ancestors = Folder.find_by_sql([ <<~SQL.squish, parent_id ])
+      WITH RECURSIVE lineage(id, parent_id, depth) AS (
+        SELECT id, parent_id, 0 FROM folders WHERE id = ?
+        UNION ALL
+        SELECT folders.id, folders.parent_id, lineage.depth + 1
+        FROM folders INNER JOIN lineage ON folders.id = lineage.parent_id
+      )
+      SELECT folders.* FROM folders
+      INNER JOIN lineage ON folders.id = lineage.id
+      WHERE folders.is_root = FALSE
+      ORDER BY lineage.depth DESC
+    SQL
 
-    lineage
+    ancestors << self
   end
 
   def to_param
-    "#{id}-#{name.squish.parameterize}"
+    "#{id}-#{name.parameterize}"
   end
 
   private
 
+  # A saved folder whose parent, campaign, and root flag are unchanged was
+  # already validated against its parent; skip loading it again on rename.
+  def placement_unchanged?
+    persisted? && !will_save_change_to_parent_id? && !will_save_change_to_campaign_id? && !will_save_change_to_is_root?
+  end
+
   def folder_parent_from_same_campaign
+    return if placement_unchanged?
     return if parent.blank?
     return if campaign.blank?
     return if parent.campaign_id == campaign_id
@@ -40,6 +71,7 @@ class Folder < ApplicationRecord
   end
 
   def root_folder_has_no_parent
+    return if placement_unchanged?
     return unless is_root? && parent.present?
     errors.add(:parent_id, "must be nil for the root folder.")
   end
@@ -10,10 +10,19 @@ class Image < ApplicationRecord
 
   validate :album_belongs_to_same_campaign
 
+  before_create :assign_position, if: -> { position.nil? && album.present? }
+
   private
   def album_belongs_to_same_campaign
+    return if persisted? && !will_save_change_to_album_id? && !will_save_change_to_campaign_id?
     return if album.nil?
     return if album.campaign_id == campaign_id
     errors.add(:album_id, "must belong to same campaign")
   end
+
+  # Store the image's place in its album when it is added, so album order is
+  # read straight off the (album_id, position) index.
+  def assign_position
+    self.position = album.images.maximum(:position).to_i + 1
+  end
 end
@@ -3,7 +3,8 @@ class InviteCode < ApplicationRecord
 
   scope :unused, -> { where(used_at: nil) }
 
-  validates :token, presence: true, uniqueness: true
+  validates :token, presence: true
+  validates :token, uniqueness: true, if: :will_save_change_to_token?
 
   def use!(user)
     self.used_at = Time.current
@@ -11,9 +12,13 @@ class InviteCode < ApplicationRecord
     save!
   end
 
+  # Inserts the whole batch with a single statement, so it is all-or-nothing.
+  # The unique index on token stands in for the per-record validation.
   def self.generate!(count: 1)
-    Array.new(count.to_i) do
-      create!(token: SecureRandom.urlsafe_base64(12)).token
-    end
+    tokens = Array.new(count.to_i) { SecureRandom.urlsafe_base64(12) }
+    return tokens if tokens.empty?
+
+    insert_all!(tokens.map { |token| { token: token } })
+    tokens
   end
 end
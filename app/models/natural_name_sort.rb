@@ -1,13 +1,18 @@
 module NaturalNameSort
+  # Captures digit runs and text runs separately so each segment is classified
+  # by the scan itself rather than by matching it a second time.
+  SEGMENT_PATTERN = /(\d+)|(\D+)/
+
   module_function
 
   def sort(records, attribute = :name)
     records.to_a.each_with_index.sort_by do |(record, index)|
       value = record.public_send(attribute).to_s
+      downcased = value.downcase
 
       [
-        key_for(value),
-        value.downcase,
+        downcased_key_for(downcased),
+        downcased,
         value,
         index
       ]
@@ -15,12 +20,13 @@ module NaturalNameSort
   end
 
   def key_for(value)
-    value.to_s.scan(/\d+|\D+/).map do |segment|
-      if segment.match?(/\A\d+\z/)
-        [ 0, segment.to_i ]
-      else
-        [ 1, segment.downcase ]
-      end
+    downcased_key_for(value.to_s.downcase)
+  end
+
+  # Expects an already downcased value so each name is only case-folded once.
+  def downcased_key_for(downcased)
+    downcased.scan(SEGMENT_PATTERN).map do |digits, text|
+      digits ? [ 0, digits.to_i ] : [ 1, text ]
     end
   end
 end
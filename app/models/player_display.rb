@@ -4,13 +4,16 @@ class PlayerDisplay < ApplicationRecord
 
   enum :transition_type, { crossfade: 0, instant: 1 }
 
-  validates :campaign_id, uniqueness: true
+  # Both checks query other rows, so they only run when the columns they
+  # guard change; toggling the title or transition skips them.
+  validates :campaign_id, uniqueness: true, if: :will_save_change_to_campaign_id?
   validates :transition_type, presence: true
 
   validate :current_image_belongs_to_same_campaign
 
   private
   def current_image_belongs_to_same_campaign
+    return unless will_save_change_to_current_image_id? || will_save_change_to_campaign_id?
     return if current_image.nil?
     return if campaign.blank?
     return if current_image.campaign_id == campaign_id
@@ -8,10 +8,11 @@ class PresentationEvent < ApplicationRecord
   validates :event_type, presence: true
 
   def self.recent_for_panel(campaign, excluding_image: nil, limit: 3)
+    # The window function and the outer query each define their own order,
+    # so the inner scope is left unsorted to avoid a redundant sort pass.
     scope = campaign.presentation_events
                     .presented
                     .where.not(image_id: nil)
-                    .order(created_at: :desc)
     scope = scope.where.not(image_id: excluding_image.id) if excluding_image
 
     ranked_scope = scope.select(
@@ -19,9 +20,12 @@ class PresentationEvent < ApplicationRecord
       "ROW_NUMBER() OVER (PARTITION BY image_id ORDER BY created_at DESC, id DESC) AS presentation_rank"
     )
 
+    # The panel checks each event's image and links through its campaign, so
+    # both are preloaded instead of being fetched once per listed event.
     from("(#{ranked_scope.to_sql}) presentation_events")
       .where("presentation_rank = 1")
       .order(created_at: :desc, id: :desc)
       .limit(limit)
+      .preload(:image, :campaign)
   end
 end
@@ -1,6 +1,13 @@
 class FolderTreePresenter
   include Rails.application.routes.url_helpers
 
+  # Only what the nodes and their slugs use; descriptions can be long and are
+  # never part of the tree payload.
+  FOLDER_COLUMNS = %w[folders.id folders.campaign_id folders.parent_id folders.name].freeze
+  ALBUM_COLUMNS = %w[albums.id albums.folder_id albums.name].freeze
+  # Bump whenever the shape of #as_json changes, so cached trees revalidate.
+  PAYLOAD_VERSION = 1
+
   def initialize(campaign)
     @campaign = campaign
   end
@@ -9,12 +16,19 @@ class FolderTreePresenter
     root = folders_by_parent_id[nil]&.first
     return {} unless root
 
-    build_node(root).merge(
+    build_tree(root).merge(
       new_root_folder_url: new_folder_folder_path(root),
       new_root_album_url: new_folder_album_path(root)
     )
   end
 
+  # Changes whenever a folder, album, or image in the campaign is added,
+  # removed, or updated, so clients can revalidate the tree cheaply.
+  def cache_version
+    relations = [ @campaign.folders, @campaign.albums, @campaign.images ]
+    [ PAYLOAD_VERSION, *relations.map(&:cache_version) ]
+  end
+
   private
 
   def folders_by_parent_id
@@ -26,49 +40,68 @@ class FolderTreePresenter
   end
 
   def all_folders
-    @all_folders ||= NaturalNameSort.sort(@campaign.folders)
+    @all_folders ||= NaturalNameSort.sort(@campaign.folders.select(FOLDER_COLUMNS))
   end
 
   def all_albums
-    @all_albums ||= NaturalNameSort.sort(
-      @campaign.albums
-        .left_outer_joins(:images)
-        .select("albums.*, COUNT(images.id) AS image_count")
-        .group("albums.id")
-    )
+    @all_albums ||= NaturalNameSort.sort(@campaign.albums.with_image_count(ALBUM_COLUMNS))
+  end
+
+  # Walks the folders breadth-first with an explicit queue rather than
+  # recursing, so deep libraries don't grow the call stack per level.
+  def build_tree(root)
+    root_node = build_node(root)
+    pending = [ [ root, root_node ] ]
+
+    until pending.empty?
+      folder, node = pending.shift
+
+      child_folders_for(folder).each do |child_folder|
+        child_node = build_node(child_folder)
+        node[:folders] << child_node
+        pending << [ child_folder, child_node ]
+      end
+    end
+
+    root_node
+  end
+
+  def child_folders_for(folder)
+    folders_by_parent_id[folder.id] || []
   end
 
   def build_node(folder)
-    child_folders = folders_by_parent_id[folder.id] || []
     albums = albums_by_folder_id[folder.id] || []
+    # Each path helper would otherwise re-parameterize the name.
+    param = folder.to_param
 
     {
       id: folder.id,
+      type: "folder",
       campaignId: folder.campaign_id,
       name: folder.name,
-      url: folder_path(folder),
-      edit_url: edit_folder_path(folder),
-      new_subfolder_url: new_folder_folder_path(folder),
+      url: folder_path(param),
+      edit_url: edit_folder_path(param),
+      new_subfolder_url: new_folder_folder_path(param),
       new_album_url: new_album_path(folder_id: folder.id),
-      child_folder_count: child_folders.size,
+      child_folder_count: child_folders_for(folder).size,
       album_count: albums.size,
-      image_count: albums.sum { |album| album_image_count(album) },
-      folders: child_folders.map { |child_folder| build_node(child_folder) },
+      image_count: albums.sum(&:image_count),
+      folders: [], # filled in by build_tree
       albums: albums.map { |album| build_album(album) }
     }
   end
 
   def build_album(album)
+    param = album.to_param
+
     {
       id: album.id,
+      type: "album",
       name: album.name,
-      url: album_path(album),
-      edit_url: edit_album_path(album),
-      image_count: album_image_count(album)
+      url: album_path(param),
+      edit_url: edit_album_path(param),
+      image_count: album.image_count
     }
   end
-
-  def album_image_count(album)
-    album.read_attribute(:image_count).to_i
-  end
 end
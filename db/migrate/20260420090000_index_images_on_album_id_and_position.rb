@@ -0,0 +1,6 @@
+class IndexImagesOnAlbumIdAndPosition < ActiveRecord::Migration[8.1]
+  def change
+    remove_index :images, :album_id
+    add_index :images, [ :album_id, :position ]
+  end
+end
@@ -0,0 +1,6 @@
+class AddUpdatedAtToCampaignsUserIndex < ActiveRecord::Migration[8.1]
+  def change
+    remove_index :campaigns, :user_id
+    add_index :campaigns, [ :user_id, :updated_at ]
+  end
+end
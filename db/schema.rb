@@ -10,7 +10,7 @@
 #
 # It's strongly recommended that you check this file into your version control system.
 
-ActiveRecord::Schema[8.1].define(version: 2026_04_18_001000) do
+ActiveRecord::Schema[8.1].define(version: 2026_04_20_091000) do
   create_table "active_storage_attachments", force: :cascade do |t|
     t.bigint "blob_id", null: false
     t.datetime "created_at", null: false
@@ -56,7 +56,7 @@ ActiveRecord::Schema[8.1].define(version: 2026_04_18_001000) do
     t.string "name", null: false
     t.datetime "updated_at", null: false
     t.integer "user_id", null: false
-    t.index ["user_id"], name: "index_campaigns_on_user_id"
+    t.index ["user_id", "updated_at"], name: "index_campaigns_on_user_id_and_updated_at"
   end
 
   create_table "folders", force: :cascade do |t|
@@ -81,7 +81,7 @@ ActiveRecord::Schema[8.1].define(version: 2026_04_18_001000) do
     t.boolean "show_title", default: false, null: false
     t.string "title"
     t.datetime "updated_at", null: false
-    t.index ["album_id"], name: "index_images_on_album_id"
+    t.index ["album_id", "position"], name: "index_images_on_album_id_and_position"
     t.index ["campaign_id"], name: "index_images_on_campaign_id"
   end
 
@@ -172,6 +172,7 @@ class AlbumsControllerTest < ActionDispatch::IntegrationTest
     assert_equal album.id, payload["id"]
     assert_equal "New Gallery", payload["name"]
     assert_equal album_path(album), payload["url"]
+    assert_equal edit_album_path(album), payload["edit_url"]
   end
 
   test "updating an album moves its campaign to the top of recent activity" do
@@ -122,6 +122,17 @@ class CampaignsControllerTest < ActionDispatch::IntegrationTest
     assert_operator response.body.index(older_campaign.name), :<, response.body.index(newer_campaign.name)
   end
 
+  test "showing a recently active campaign does not touch it again" do
+    campaign = create(:campaign, user: @user)
+    campaign.update_columns(updated_at: 10.seconds.ago)
+
+    assert_no_changes -> { campaign.reload.updated_at } do
+      get campaign_path(campaign)
+    end
+
+    assert_response :success
+  end
+
   test "shows the new campaign form" do
     get new_campaign_path
 
@@ -170,6 +181,7 @@ class CampaignsControllerTest < ActionDispatch::IntegrationTest
     payload = JSON.parse(response.body)
 
     assert_equal root_folder.id, payload["id"]
+    assert_equal "folder", payload["type"]
     assert_equal campaign.id, payload["campaignId"]
     assert_equal root_folder.name, payload["name"]
     assert_equal folder_path(root_folder), payload["url"]
@@ -183,6 +195,7 @@ class CampaignsControllerTest < ActionDispatch::IntegrationTest
     assert_equal new_folder_album_path(root_folder), payload["new_root_album_url"]
 
     root_album_payload = payload.fetch("albums").find { |album| album["id"] == root_album.id }
+    assert_equal "album", root_album_payload["type"]
     assert_equal root_album.name, root_album_payload["name"]
     assert_equal album_path(root_album), root_album_payload["url"]
     assert_equal edit_album_path(root_album), root_album_payload["edit_url"]
@@ -231,6 +244,22 @@ class CampaignsControllerTest < ActionDispatch::IntegrationTest
     assert_equal [ "Map 1", "Map 2", "Map 10" ], payload.fetch("albums").map { |album| album.fetch("name") }
   end
 
+  test "returns not modified for an unchanged campaign tree" do
+    campaign = create(:campaign, user: @user, name: "North Reach")
+    folder = create(:folder, campaign: campaign, parent: campaign.root_folder, name: "Locations")
+
+    get tree_campaign_path(campaign)
+    etag = response.headers["ETag"]
+
+    get tree_campaign_path(campaign), headers: { "If-None-Match" => etag }
+    assert_response :not_modified
+
+    folder.update!(name: "Landmarks")
+    get tree_campaign_path(campaign), headers: { "If-None-Match" => etag }
+    assert_response :success
+    assert_equal [ "Landmarks" ], JSON.parse(response.body).fetch("folders").map { |child| child.fetch("name") }
+  end
+
   test "re-renders the new campaign form when creation is invalid" do
     assert_no_difference("Campaign.count") do
       post campaigns_path, params: {
@@ -201,6 +201,8 @@ class FoldersControllerTest < ActionDispatch::IntegrationTest
     assert_equal folder.id, payload["id"]
     assert_equal "Villains", payload["name"]
     assert_equal folder_path(folder), payload["url"]
+    assert_equal edit_folder_path(folder), payload["edit_url"]
+    assert_equal new_folder_folder_path(folder), payload["new_subfolder_url"]
   end
 
   test "re-renders the edit folder form when the update is invalid" do
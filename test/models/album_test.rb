@@ -37,6 +37,25 @@ class AlbumTest < ActiveSupport::TestCase
     assert_nil Image.find_by(id: image.id)
   end
 
+  test "with_image_count selects each album's image count" do
+    album = create(:album)
+    create_list(:image, 2, campaign: album.campaign, album: album)
+    empty_album = create(:album, campaign: album.campaign, folder: album.folder)
+
+    counts = Album.with_image_count.where(id: [ album.id, empty_album.id ]).to_h { |record| [ record.id, record.image_count ] }
+
+    assert_equal({ album.id => 2, empty_album.id => 0 }, counts)
+  end
+
+  test "with_image_count can limit the selected album columns" do
+    album = create(:album, description: "Maps of the sunken archive")
+
+    record = Album.with_image_count(%w[albums.id albums.name]).find(album.id)
+
+    assert_equal 0, record.image_count
+    assert_not record.has_attribute?(:description)
+  end
+
   test "images are ordered by position ascending" do
     album = create(:album)
     image_two = create(:image, campaign: album.campaign, album: album, position: 2)
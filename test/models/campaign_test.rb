@@ -51,4 +51,10 @@ class CampaignTest < ActiveSupport::TestCase
 
     assert_nil PresentationEvent.find_by(id: presentation_event.id)
   end
+
+  test "to_param collapses surrounding and repeated whitespace in the name" do
+    campaign = create(:campaign, name: "  The   Lost  Mine ")
+
+    assert_equal "#{campaign.id}-the-lost-mine", campaign.to_param
+  end
 end
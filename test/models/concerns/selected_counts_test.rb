@@ -0,0 +1,19 @@
+require "test_helper"
+
+class SelectedCountsTest < ActiveSupport::TestCase
+  test "reads the selected count when the query includes it" do
+    album = create(:album)
+    create(:image, campaign: album.campaign, album: album)
+
+    record = Album.select("albums.*", "7 AS image_count").find(album.id)
+
+    assert_equal 7, record.image_count
+  end
+
+  test "falls back to counting the association" do
+    album = create(:album)
+    create(:image, campaign: album.campaign, album: album)
+
+    assert_equal 1, Album.find(album.id).image_count
+  end
+end
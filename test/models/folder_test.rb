@@ -64,6 +64,14 @@ class FolderTest < ActiveSupport::TestCase
     assert_includes folder.errors[:is_root], "has already been taken"
   end
 
+  test "renaming a saved folder does not load its parent" do
+    folder = Folder.find(create(:folder).id)
+
+    folder.update!(name: "Renamed")
+
+    assert_not folder.association(:parent).loaded?
+  end
+
   test "ancestry returns folders from the top-most ancestor through self without the root" do
     campaign = create(:campaign)
     district = create(:folder, campaign: campaign, parent: campaign.root_folder, name: "Districts")
@@ -73,6 +81,17 @@ class FolderTest < ActiveSupport::TestCase
     assert_equal [ district, villagers, market ], market.ancestry
   end
 
+  test "ancestry loads the whole parent chain in a single query" do
+    campaign = create(:campaign)
+    district = create(:folder, campaign: campaign, parent: campaign.root_folder, name: "Districts")
+    villagers = create(:folder, campaign: campaign, parent: district, name: "Villagers")
+    market = Folder.find(create(:folder, campaign: campaign, parent: villagers, name: "Market Square").id)
+
+    assert_queries_count(1) do
+      assert_equal [ district, villagers, market ], market.ancestry
+    end
+  end
+
   test "ancestry is empty for the root folder" do
     campaign = create(:campaign)
 
@@ -89,4 +108,17 @@ class FolderTest < ActiveSupport::TestCase
     assert_nil Folder.find_by(id: child_folder.id)
     assert_nil Album.find_by(id: album.id)
   end
+
+  test "with_child_counts selects each folder's child folder and album counts" do
+    folder = create(:folder)
+    create_list(:folder, 2, campaign: folder.campaign, parent: folder)
+    create(:album, campaign: folder.campaign, folder: folder)
+    empty_folder = create(:folder, campaign: folder.campaign, parent: folder.parent)
+
+    counts = Folder.with_child_counts.where(id: [ folder.id, empty_folder.id ]).to_h do |record|
+      [ record.id, [ record.child_folder_count, record.album_count ] ]
+    end
+
+    assert_equal({ folder.id => [ 2, 1 ], empty_folder.id => [ 0, 0 ] }, counts)
+  end
 end
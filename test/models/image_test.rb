@@ -68,6 +68,23 @@ class ImageTest < ActiveSupport::TestCase
     assert_includes image.errors[:album_id], "must belong to same campaign"
   end
 
+  test "new images are positioned after the existing images in their album" do
+    album = create(:album)
+    create(:image, campaign: album.campaign, album: album, position: 4)
+
+    image = create(:image, campaign: album.campaign, album: album)
+
+    assert_equal 5, image.position
+  end
+
+  test "renaming a saved image does not load its album" do
+    image = Image.find(create(:image).id)
+
+    image.update!(title: "Renamed")
+
+    assert_not image.association(:album).loaded?
+  end
+
   test "destroying an image nullifies its presentation events" do
     presentation_event = create(:presentation_event)
     original_title = presentation_event.image_title
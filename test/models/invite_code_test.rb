@@ -36,6 +36,12 @@ class InviteCodeTest < ActiveSupport::TestCase
     assert_equal tokens.sort, InviteCode.where(token: tokens).pluck(:token).sort
   end
 
+  test "generate! inserts the batch in a single query" do
+    assert_queries_count(1) do
+      InviteCode.generate!(count: 5)
+    end
+  end
+
   test "destroying the user nullifies the used_by association" do
     user = create(:user)
     invite_code = create(:invite_code)
@@ -0,0 +1,21 @@
+require "test_helper"
+
+class NaturalNameSortTest < ActiveSupport::TestCase
+  Named = Struct.new(:name)
+
+  test "sorts numeric segments by value" do
+    records = [ "Session 10", "Session 2", "Session 1" ].map { |name| Named.new(name) }
+
+    assert_equal [ "Session 1", "Session 2", "Session 10" ], NaturalNameSort.sort(records).map(&:name)
+  end
+
+  test "sorts case-insensitively and keeps ties stable" do
+    records = [ "beta", "Alpha", "alpha", "Beta" ].map { |name| Named.new(name) }
+
+    assert_equal [ "Alpha", "alpha", "Beta", "beta" ], NaturalNameSort.sort(records).map(&:name)
+  end
+
+  test "key_for ignores case" do
+    assert_equal NaturalNameSort.key_for("Map 2"), NaturalNameSort.key_for("map 2")
+  end
+end
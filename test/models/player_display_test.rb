@@ -45,6 +45,14 @@ class PlayerDisplayTest < ActiveSupport::TestCase
     assert_includes player_display.errors[:current_image_id], "must belong to same campaign"
   end
 
+  test "saving unrelated changes skips the campaign and image lookups" do
+    player_display = PlayerDisplay.find(create(:player_display, :with_current_image).id)
+
+    assert_no_queries_match(/FROM "(player_displays|images)"/) do
+      player_display.update!(show_title: true)
+    end
+  end
+
   test "destroying a campaign destroys its player display" do
     campaign = create(:campaign)
     player_display = create(:player_display, :with_current_image, campaign: campaign)
@@ -93,6 +93,20 @@ class PresentationEventTest < ActiveSupport::TestCase
                  PresentationEvent.recent_for_panel(campaign).map(&:id)
   end
 
+  test "recent for panel preloads each event's image and campaign" do
+    campaign = create(:campaign)
+    create_list(:presentation_event, 2, campaign: campaign)
+
+    events = PresentationEvent.recent_for_panel(campaign).to_a
+
+    assert_queries_count(0) do
+      events.each do |event|
+        event.image
+        event.campaign
+      end
+    end
+  end
+
   test "image title snapshot persists after the image is destroyed" do
     presentation_event = create(:presentation_event)
     image_title = presentation_event.image_title
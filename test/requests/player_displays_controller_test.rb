@@ -206,8 +206,8 @@ class PlayerDisplaysControllerTest < ActionDispatch::IntegrationTest
     assert_response :success
     assert_equal Mime[:turbo_stream].to_s, response.media_type
     assert_equal false, player_display.reload.show_title
-    assert_includes response.body, 'target="gm-panel-header"'
     assert_includes response.body, 'target="gm-status"'
+    assert_not_includes response.body, 'target="gm-panel-header"'
   end
 
   test "update transition updates transition type and returns turbo stream" do